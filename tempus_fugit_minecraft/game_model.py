@@ -9,7 +9,7 @@ from pyglet.graphics import TextureGroup, Batch
 from pyglet import image
 from tempus_fugit_minecraft import sound_list
 from tempus_fugit_minecraft.block import Block
-from tempus_fugit_minecraft.player import Player
+from tempus_fugit_minecraft.player import Direction, Player
 from tempus_fugit_minecraft.utilities import FACES, TICKS_PER_SEC, cube_vertices
 from tempus_fugit_minecraft.world import World, normalize, sectorize, Position
 
@@ -341,9 +341,12 @@ class GameModel(object):
         self.player.check_player_within_world_boundaries()
 
         moves = 8
-        delta_time_in_seconds = min(delta_time_in_seconds, 0.2)
+        delta_time_per_move_in_seconds = min(delta_time_in_seconds, 0.2) / moves
+        # Look up the bound methods once instead of on every move.
+        update_player = self.player.update
+        collide = self.collide
         for _ in xrange(moves):
-            self.player.update(delta_time_in_seconds / moves, self.collide)
+            update_player(delta_time_per_move_in_seconds, collide)
 
     def collide(self, position: tuple, height: int) -> tuple:
         """!
@@ -360,8 +363,8 @@ class GameModel(object):
         # need to have to count as a collision. If 0, touching terrain
         # at all counts as a collision. If .49, you sink into the
         # ground, as if walking through tall grass. If >= .5, you'll
-        # fall through the ground.
-        pad = 0.25
+        # fall through the ground. Player.update sizes its collision steps from this value.
+        pad = self.player.COLLISION_PAD_IN_BLOCKS
         p = list(position)
         np = normalize(position)
         for face in FACES:  # check all surrounding blocks
@@ -455,23 +458,21 @@ class GameModel(object):
             or stopping
         @see [Issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
         """
-        def handle_movement_for_direction(direction, move, stop):
+        def handle_movement_for_direction(state, direction):
             """!
             @brief Private helper for consistently applying direction
+            @param state : Tri-state value of 1, 0, -1 indicating if we are moving, staying constant, or stopping
             @param direction : The direction to apply the movement to
-            @param move : The function to call when we are moving in the given direction
-            @param stop : The function to call when we are stopping in the given direction
             """
-            if direction != 0:
-                if direction == 1:
-                    move()
-                else:
-                    stop()
-
-        handle_movement_for_direction(forward, self.player.move_forward, self.player.stop_forward)
-        handle_movement_for_direction(backward, self.player.move_backward, self.player.stop_backward)
-        handle_movement_for_direction(left, self.player.move_left, self.player.stop_left)
-        handle_movement_for_direction(right, self.player.move_right, self.player.stop_right)
+            if state == 1:
+                self.player.press(direction)
+            elif state == -1:
+                self.player.release(direction)
+
+        handle_movement_for_direction(forward, Direction.FORWARD)
+        handle_movement_for_direction(backward, Direction.BACKWARD)
+        handle_movement_for_direction(left, Direction.LEFT)
+        handle_movement_for_direction(right, Direction.RIGHT)
 
     def handle_flight(self, ascending, descending):
         """!
@@ -1,8 +1,33 @@
+from enum import Enum, auto
 from typing import Callable
 from tempus_fugit_minecraft.world import World
 from tempus_fugit_minecraft.block import Block
 import math
 
+# Conversion factors between degrees and radians, matching math.radians and math.degrees without the function call.
+_DEGREES_TO_RADIANS = math.pi / 180.0
+_RADIANS_TO_DEGREES = 180.0 / math.pi
+
+# Cosine and sine of the strafe angle for each of the eight non-zero strafe unit vectors, so the motion vector never
+# has to call atan2. The cached horizontal rotation is x - 90, so each strafe angle is shifted by +90 to compensate,
+# giving cos(strafe + 90) = -sin(strafe) and sin(strafe + 90) = cos(strafe).
+_STRAFE_TRIG = {
+    (forward, lateral): (-math.sin(math.atan2(forward, lateral)), math.cos(math.atan2(forward, lateral)))
+    for forward in (-1, 0, 1)
+    for lateral in (-1, 0, 1)
+    if forward or lateral
+}
+
+
+class Direction(Enum):
+    """!
+    @brief The directions a player can move in, relative to the direction they are facing.
+    """
+    FORWARD = auto()
+    BACKWARD = auto()
+    LEFT = auto()
+    RIGHT = auto()
+
 
 class Player:
     """!
@@ -10,31 +35,81 @@ class Player:
         player position, player sight vector, and more.
     @return player An instance of Player class.
     """
+    # Only the per-player state is stored on the instance. Declaring it here gives each Player fixed attribute
+    # storage instead of a __dict__, which makes the attribute reads in `update()` cheaper.
+    __slots__ = (
+        'jump_speed_in_blocks_per_second',
+        'walking_speed_in_blocks_per_second',
+        'flying',
+        'ascend',
+        'descend',
+        '_forward_held',
+        '_backward_held',
+        '_left_held',
+        '_right_held',
+        '_forward',
+        '_lateral',
+        'position_in_blocks_from_origin',
+        '_rotation_in_radians',
+        '_horizontal_forward',
+        '_horizontal_right',
+        '_cos_y',
+        '_sin_y',
+        '_sight_vector',
+        'vertical_velocity_in_blocks_per_second',
+        'inventory',
+        'selected_block',
+    )
+
+    PLAYER_HEIGHT_IN_BLOCKS = 2
+    MAX_FALL_SPEED_IN_BLOCKS_PER_SECOND = 50
+    FLYING_SPEED_IN_BLOCKS_PER_SECOND = 15
+    MAX_SPEED_IN_BLOCKS_PER_SECOND = 15
+    MIN_SPEED_IN_BLOCKS_PER_SECOND = 5
+    WALK_SPEED_IN_BLOCKS_PER_SECOND = 5
+
+    MAX_JUMP_HEIGHT_IN_BLOCKS = 1.0
+    GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED = 20.0
+
+    # To derive the formula for calculating jump speed, first solve
+    #    v_t = v_0 + a * t
+    # for the time at which you achieve maximum height, where a is the acceleration
+    # due to gravity and v_t = 0. This gives:
+    #    t = - v_0 / a
+    # Use t and the desired MAX_JUMP_HEIGHT to solve for v_0 (jump speed) in
+    #    s = s_0 + v_0 * t + (a * t^2) / 2
+    # All inputs are constants, so this is evaluated once when the class is defined.
+    INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND = int(math.sqrt(2 * GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED * MAX_JUMP_HEIGHT_IN_BLOCKS))
+    MAX_JUMP_SPEED_IN_BLOCKS_PER_SECOND = INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND + 10
+    MIN_JUMP_SPEED_IN_BLOCKS_PER_SECOND = INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND
+
+    # How far the player turns for each pixel the mouse moves.
+    MOUSE_SENSITIVITY_IN_RADIANS = 0.15 * _DEGREES_TO_RADIANS
+    # How far the player can look up or down from the ground plane.
+    MAX_PITCH_IN_RADIANS = math.pi / 2
+
+    # How far the player has to overlap a neighbouring block before GameModel.collide pushes them back out.
+    COLLISION_PAD_IN_BLOCKS = 0.25
+    # The longest distance the player can move along any axis between two collision checks. collide only reacts to an
+    # overlap between the pad and half a block, so a longer step could jump over that window and into the block.
+    MAX_COLLISION_STEP_IN_BLOCKS = 0.5 - COLLISION_PAD_IN_BLOCKS
+
+    # The blocks every player can place. The inventory never changes size, so its length is computed only once.
+    INVENTORY = (Block.BRICK, Block.GRASS, Block.SAND, Block.TREE_TRUNK, Block.TREE_LEAVES, Block.LIGHT_CLOUD,
+                 Block.DARK_CLOUD)
+    INVENTORY_SIZE = len(INVENTORY)
+
     def __init__(self) -> None:
         """!
         @brief Initializes an instance of the Player class
         @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
         """
-        self.MAX_JUMP_HEIGHT_IN_BLOCKS = 1.0
-        self.PLAYER_HEIGHT_IN_BLOCKS = 2
-        self.MAX_FALL_SPEED_IN_BLOCKS_PER_SECOND = 50
-        self.FLYING_SPEED_IN_BLOCKS_PER_SECOND = 15
-        self.GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED = 20.0
-        self.MAX_SPEED_IN_BLOCKS_PER_SECOND = 15
-        self.MIN_SPEED_IN_BLOCKS_PER_SECOND = 5
-
-        # To derive the formula for calculating jump speed, first solve
-        #    v_t = v_0 + a * t
-        # for the time at which you achieve maximum height, where a is the acceleration
-        # due to gravity and v_t = 0. This gives:
-        #    t = - v_0 / a
-        # Use t and the desired MAX_JUMP_HEIGHT to solve for v_0 (jump speed) in
-        #    s = s_0 + v_0 * t + (a * t^2) / 2
-        self.INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND = int(math.sqrt(2 * self.GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED * self.MAX_JUMP_HEIGHT_IN_BLOCKS))
-        self.MAX_JUMP_SPEED_IN_BLOCKS_PER_SECOND = self.INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND + 10
-        self.MIN_JUMP_SPEED_IN_BLOCKS_PER_SECOND = self.INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND
-        self.WALK_SPEED_IN_BLOCKS_PER_SECOND = 5
+        self.reset()
 
+    def reset(self) -> None:
+        """!
+        @brief Restores the player to the state of a newly constructed player.
+        """
         self.jump_speed_in_blocks_per_second = self.INITIAL_JUMP_SPEED_IN_BLOCKS_PER_SECOND
         self.walking_speed_in_blocks_per_second = self.WALK_SPEED_IN_BLOCKS_PER_SECOND
        
@@ -45,40 +120,111 @@ class Player:
         # Strafing is moving lateral to the direction you are facing, e.g. moving to the left or right while
         # continuing to face forward.
 
-        # First element is -1 when moving forward, 1 when moving back, and 0 otherwise.
-        # The second element is -1 when moving left, 1 when moving right, and 0 otherwise.
-        self.strafe_unit_vector = [0, 0]
+        # Whether each movement key is currently held down.
+        self._forward_held = False
+        self._backward_held = False
+        self._left_held = False
+        self._right_held = False
+        # -1 when moving forward, 1 when moving back, and 0 otherwise.
+        self._forward = 0
+        # -1 when moving left, 1 when moving right, and 0 otherwise.
+        self._lateral = 0
         # Current (x, y, z) position in the world, specified with floats. Note that, perhaps unlike in math class,
         # the y-axis is the vertical axis.
         self.position_in_blocks_from_origin = (0, 0, 0)
         # First element is rotation of the player in the x-z plane (ground plane) measured from the z-axis down. The
-        # second is the rotation angle from the ground plane up. Rotation is in degrees.
+        # second is the rotation angle from the ground plane up. Rotation is stored in radians; use
+        # `rotation_in_degrees` where degrees are needed.
 
-        # The vertical plane rotation ranges from -90 (looking straight down) to 90 (looking straight up). The
+        # The vertical plane rotation ranges from -pi/2 (looking straight down) to pi/2 (looking straight up). The
         # horizontal rotation range is unbounded.
-        self.rotation_in_degrees = (0, 0)
+        self.rotation_in_radians = (0.0, 0.0)
         # Velocity in the y (upward) direction.
         self.vertical_velocity_in_blocks_per_second = 0
         # A list of blocks the player can place. Hit num keys to cycle.
-        self.inventory = [Block.BRICK, Block.GRASS, Block.SAND, Block.TREE_TRUNK, Block.TREE_LEAVES, Block.LIGHT_CLOUD, Block.DARK_CLOUD]
+        self.inventory = self.INVENTORY
         # The current block the user can place. Hit num keys to cycle.
         self.selected_block = self.inventory[0]
 
+    @property
+    def rotation_in_radians(self) -> tuple:
+        """!
+        @brief The (horizontal, vertical) rotation of the player in radians.
+        @return A tuple containing the rotation in the x-z plane and the rotation from the ground plane up.
+        """
+        return self._rotation_in_radians
+
+    @rotation_in_radians.setter
+    def rotation_in_radians(self, rotation: tuple) -> None:
+        """!
+        @brief Sets the rotation of the player and caches the horizontal forward and right unit vectors, the sine and
+            cosine of the vertical angle and the sight vector, so neither the sight nor the motion vector needs to
+            evaluate any trig functions until the player looks somewhere else.
+        @param rotation A tuple containing the rotation in the x-z plane and the rotation from the ground plane up.
+        """
+        self._rotation_in_radians = rotation
+        x, y = rotation
+        cos_x = math.cos(x - math.pi / 2)
+        sin_x = math.sin(x - math.pi / 2)
+        # Unit vectors in the x-z plane pointing where the player faces and to the player's right.
+        self._horizontal_forward = (cos_x, sin_x)
+        self._horizontal_right = (-sin_x, cos_x)
+        self._cos_y = math.cos(y)
+        self._sin_y = math.sin(y)
+        # y ranges from -pi/2 to pi/2, so m ranges from 0 to 1 and is 1 when looking ahead parallel to
+        # the ground and 0 when looking straight up or down.
+        m = self._cos_y
+        # dy ranges from -1 to 1 and is -1 when looking straight down and 1 when looking straight up.
+        dy = self._sin_y
+        self._sight_vector = (cos_x * m, dy, sin_x * m)
+
+    @property
+    def rotation_in_degrees(self) -> tuple:
+        """!
+        @brief The (horizontal, vertical) rotation of the player in degrees, converted from the stored radians.
+        @return A tuple containing the rotation in the x-z plane and the rotation from the ground plane up.
+        """
+        x, y = self._rotation_in_radians
+        return x * _RADIANS_TO_DEGREES, y * _RADIANS_TO_DEGREES
+
+    @rotation_in_degrees.setter
+    def rotation_in_degrees(self, rotation: tuple) -> None:
+        """!
+        @brief Sets the rotation of the player from a rotation given in degrees.
+        @param rotation A tuple containing the rotation in the x-z plane and the rotation from the ground plane up.
+        """
+        x, y = rotation
+        self.rotation_in_radians = (x * _DEGREES_TO_RADIANS, y * _DEGREES_TO_RADIANS)
+
+    @property
+    def strafe_unit_vector(self) -> tuple:
+        """!
+        @brief The current strafe direction of the player.
+        @return A tuple whose first element is -1 when moving forward, 1 when moving back, and 0 otherwise, and whose
+            second element is -1 when moving left, 1 when moving right, and 0 otherwise.
+        """
+        return self._forward, self._lateral
+
+    @strafe_unit_vector.setter
+    def strafe_unit_vector(self, strafe: tuple) -> None:
+        """!
+        @brief Sets the strafe direction of the player.
+        @param strafe A pair of the forward/backward and left/right strafe components, each -1, 0 or 1.
+        """
+        forward, lateral = strafe
+        self._forward_held = forward < 0
+        self._backward_held = forward > 0
+        self._left_held = lateral < 0
+        self._right_held = lateral > 0
+        self._update_strafe()
+
     def get_sight_vector(self) -> tuple:
         """!
         @brief Returns the current line of sight vector indicating the direction the player is looking.
         @return A tuple representing the 3D vector the player is looking toward
         @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
         """
-        x, y = self.rotation_in_degrees
-        # y ranges from -90 to 90, or -pi/2 to pi/2, so m ranges from 0 to 1 and is 1 when looking ahead parallel to
-        # the ground and 0 when looking straight up or down.
-        m = math.cos(math.radians(y))
-        # dy ranges from -1 to 1 and is -1 when looking straight down and 1 when looking straight up.
-        dy = math.sin(math.radians(y))
-        dx = math.cos(math.radians(x - 90)) * m
-        dz = math.sin(math.radians(x - 90)) * m
-        return dx, dy, dz
+        return self._sight_vector
 
     def get_motion_vector(self) -> tuple:
         """!
@@ -86,33 +232,34 @@ class Player:
         @return A tuple containing the velocity in x, y, and z respectively.
         @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
         """
-        if any(self.strafe_unit_vector):
-            x, y = self.rotation_in_degrees
-            strafe = math.degrees(math.atan2(*self.strafe_unit_vector))
-            y_angle = math.radians(y)
-            x_angle = math.radians(x + strafe)
-            if self.flying:
-                m = math.cos(y_angle)
-                dy = math.sin(y_angle)
-                if self.strafe_unit_vector[1]:
-                    # Moving left or right.
-                    dy = 0.0
-                    m = 1
-                if self.strafe_unit_vector[0] > 0:
-                    # Moving backwards.
-                    dy *= -1
-                # When you are flying up or down, you have less left and right
-                # motion.
-                dx = math.cos(x_angle) * m
-                dz = math.sin(x_angle) * m
-            else:
+        forward = self._forward
+        lateral = self._lateral
+        if not (forward or lateral):
+            return 0.0, 0.0, 0.0
+        cos_strafe, sin_strafe = _STRAFE_TRIG[forward, lateral]
+        # Combine the cached horizontal basis, so no trig of the rotation itself is needed here.
+        forward_x, forward_z = self._horizontal_forward
+        right_x, right_z = self._horizontal_right
+        cos_x_angle = forward_x * cos_strafe + right_x * sin_strafe
+        sin_x_angle = forward_z * cos_strafe + right_z * sin_strafe
+        if self.flying:
+            m = self._cos_y
+            dy = self._sin_y
+            if lateral:
+                # Moving left or right.
                 dy = 0.0
-                dx = math.cos(x_angle)
-                dz = math.sin(x_angle)
+                m = 1
+            if forward > 0:
+                # Moving backwards.
+                dy *= -1
+            # When you are flying up or down, you have less left and right
+            # motion.
+            dx = cos_x_angle * m
+            dz = sin_x_angle * m
         else:
             dy = 0.0
-            dx = 0.0
-            dz = 0.0
+            dx = cos_x_angle
+            dz = sin_x_angle
         return dx, dy, dz
  
     def increase_walk_speed(self) -> None:
@@ -155,33 +302,42 @@ class Player:
         if self.jump_speed_in_blocks_per_second > self.MIN_JUMP_SPEED_IN_BLOCKS_PER_SECOND:       
             self.jump_speed_in_blocks_per_second = self.jump_speed_in_blocks_per_second - 5
 
-    def move_forward(self) -> None:
+    def press(self, direction: Direction) -> None:
         """!
-        @brief Move one space to the front
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
+        @brief Starts moving in the given direction. Holding opposite directions along the same axis cancels out.
+        @param direction The direction to start moving in.
         """
-        self.strafe_unit_vector[0] -= 1
+        self._set_held(direction, True)
 
-    def move_backward(self) -> None:
+    def release(self, direction: Direction) -> None:
         """!
-        @brief Move one space to the rear
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
+        @brief Stops moving in the given direction. Has no effect if the player is not moving in that direction.
+        @param direction The direction to stop moving in.
         """
-        self.strafe_unit_vector[0] += 1
+        self._set_held(direction, False)
 
-    def move_left(self) -> None:
+    def _set_held(self, direction: Direction, held: bool) -> None:
         """!
-        @brief Move one space to the left
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
+        @brief Records whether the key for the given direction is held down and updates the strafe direction.
+        @param direction The direction whose key was pressed or released.
+        @param held True if the key is now held down, False otherwise.
         """
-        self.strafe_unit_vector[1] -= 1
+        if direction is Direction.FORWARD:
+            self._forward_held = held
+        elif direction is Direction.BACKWARD:
+            self._backward_held = held
+        elif direction is Direction.LEFT:
+            self._left_held = held
+        else:
+            self._right_held = held
+        self._update_strafe()
 
-    def move_right(self) -> None:
+    def _update_strafe(self) -> None:
         """!
-        @brief Move one space to the right
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
+        @brief Derives the strafe direction from the held movement keys, so each component stays within -1 and 1.
         """
-        self.strafe_unit_vector[1] += 1
+        self._forward = self._backward_held - self._forward_held
+        self._lateral = self._right_held - self._left_held
 
     def jump(self) -> None:
         """!
@@ -197,37 +353,9 @@ class Player:
         @param index The current index of the inventory
         @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
         """
-        selected_index = index % len(self.inventory)
+        selected_index = index % self.INVENTORY_SIZE
         self.selected_block = self.inventory[selected_index]
 
-    def stop_forward(self) -> None:
-        """!
-        @brief Stops movement to the front
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
-        """
-        self.strafe_unit_vector[0] += 1
-
-    def stop_backward(self) -> None:
-        """!
-        @brief Stops movement to the rear
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
-        """
-        self.strafe_unit_vector[0] -= 1
-
-    def stop_left(self) -> None:
-        """!
-        @brief Stops movement to the left
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
-        """
-        self.strafe_unit_vector[1] += 1
-
-    def stop_right(self) -> None:
-        """!
-        @brief Stops movement to the right
-        @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
-        """
-        self.strafe_unit_vector[1] -= 1
-
     def adjust_sight(self, dx: int, dy: int) -> None:
         """!
         @brief Adjusts the sight vector of the player
@@ -235,12 +363,10 @@ class Player:
         @param dy The relative y-axis movement of the mouse
         @see [Issue#67](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/67)
         """
-        x, y = self.rotation_in_degrees
-        m = 0.15
-        x = dx * m + x
-        y = dy * m + y
-        y = max(-90, min(90, y))
-        self.rotation_in_degrees = (x, y)
+        x, y = self.rotation_in_radians
+        m = self.MOUSE_SENSITIVITY_IN_RADIANS
+        max_pitch = self.MAX_PITCH_IN_RADIANS
+        self.rotation_in_radians = (dx * m + x, max(-max_pitch, min(max_pitch, dy * m + y)))
 
     def current_speed(self) -> float:
         """!
@@ -266,34 +392,54 @@ class Player:
         @see [Issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
         @see [Issue#82](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/82)
         """
+        # Attributes used more than once are read into locals up front.
+        flying = self.flying
+        flying_speed = self.FLYING_SPEED_IN_BLOCKS_PER_SECOND
+        height = self.PLAYER_HEIGHT_IN_BLOCKS
+
         # walking
-        speed = self.current_speed()
+        # Same as `current_speed()`, inlined as this runs every tick.
+        speed = flying_speed if flying else self.walking_speed_in_blocks_per_second
         d = delta_time_in_seconds * speed  # distance covered this tick.
         dx, dy, dz = self.get_motion_vector()
-        # New position in space, before accounting for gravity.
-        dx, dy, dz = dx * d, dy * d, dz * d
 
         # gravity
-        if not self.flying:
+        if not flying:
             # Update your vertical speed: if you are falling, speed up
             # until you hit terminal velocity; if you are jumping, slow
             # down until you start falling.
-            self.vertical_velocity_in_blocks_per_second -= delta_time_in_seconds * self.GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED
-            self.vertical_velocity_in_blocks_per_second = max(self.vertical_velocity_in_blocks_per_second, -self.MAX_FALL_SPEED_IN_BLOCKS_PER_SECOND)
-            dy += self.vertical_velocity_in_blocks_per_second * delta_time_in_seconds
+            vertical_velocity = self.vertical_velocity_in_blocks_per_second
+            vertical_velocity -= delta_time_in_seconds * self.GRAVITY_IN_BLOCKS_PER_SECOND_SQUARED
+            vertical_velocity = max(vertical_velocity, -self.MAX_FALL_SPEED_IN_BLOCKS_PER_SECOND)
+            # Stored before the collision checks, which reset it to 0 when the player lands or hits a ceiling.
+            self.vertical_velocity_in_blocks_per_second = vertical_velocity
+            vertical_displacement = vertical_velocity * delta_time_in_seconds
         else:
             # The vertical_direction_modifier will either add or subtract one, or both, if
             # the ascending or descending properties are true, the
             # result of this will be -1, 0 or 1 which will change the
-            # direction of dy.
+            # direction of the vertical displacement.
             vertical_direction_modifier = 0
             vertical_direction_modifier += 1 if self.ascend else 0
             vertical_direction_modifier -= 1 if self.descend else 0
-            dy += vertical_direction_modifier * delta_time_in_seconds * self.FLYING_SPEED_IN_BLOCKS_PER_SECOND
+            vertical_displacement = vertical_direction_modifier * delta_time_in_seconds * flying_speed
 
         # collisions
         x, y, z = self.position_in_blocks_from_origin
-        self.position_in_blocks_from_origin = collision_checker((x + dx, y + dy, z + dz),  self.PLAYER_HEIGHT_IN_BLOCKS)
+        dx, dy, dz = dx * d, dy * d + vertical_displacement, dz * d
+        # Check for collisions at evenly spaced points along the path rather than only at its end, so that a long
+        # tick or falling at terminal velocity cannot carry the player through a block.
+        steps = max(1, math.ceil(max(abs(dx), abs(dy), abs(dz)) / self.MAX_COLLISION_STEP_IN_BLOCKS))
+        # Total amount the collision checker has pushed the player back so far.
+        offset_x = offset_y = offset_z = 0.0
+        for step in range(1, steps + 1):
+            fraction = step / steps
+            target = (x + dx * fraction + offset_x, y + dy * fraction + offset_y, z + dz * fraction + offset_z)
+            position = collision_checker(target, height)
+            offset_x += position[0] - target[0]
+            offset_y += position[1] - target[1]
+            offset_z += position[2] - target[2]
+        self.position_in_blocks_from_origin = position
 
     def check_player_within_world_boundaries(self) -> None:
         """!
@@ -317,12 +463,7 @@ class Player:
         @see [Issue#25](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/25)
         @see [Issue#84](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/84)
         """
-        if dimension > boundary_size:
-            return boundary_size
-        elif dimension < -boundary_size:
-            return -boundary_size
-        else:
-            return dimension
+        return min(max(dimension, -boundary_size), boundary_size)
 
     def slow_walking_speed(self) -> None:
         """!
@@ -330,11 +471,7 @@ class Player:
         @see [Issue#97](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/97)
         @see [Issue#115](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/115)
         """
-        # Preconditions: make sure the initial speed = 5
-        assert self.walking_speed_in_blocks_per_second == 5
-        self.walking_speed_in_blocks_per_second = self.walking_speed_in_blocks_per_second / 3
-        # Postconditions: make sure the speed decreased and it is = 5/3
-        assert self.walking_speed_in_blocks_per_second == 5 / 3
+        self.walking_speed_in_blocks_per_second /= 3
 
     def reset_walking_speed(self) -> None:
         """!
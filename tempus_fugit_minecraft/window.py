@@ -46,6 +46,24 @@ class Window(pyglet.window.Window):
             key._1, key._2, key._3, key._4, key._5,
             key._6, key._7, key._8, key._9, key._0]
 
+        # Handlers for the keys pressed while the game is running, looked up by key symbol in on_key_press.
+        self.key_press_handlers = {
+            key.Q: self.handle_speed_increase_key,
+            key.E: self.handle_speed_decrease_key,
+            key.TAB: self.handle_flight_toggle_key,
+            key.LSHIFT: self.handle_shift_key,
+            key.SPACE: self.handle_space_key,
+            key.W: self.handle_forward_key,
+            key.S: self.handle_backward_key,
+            key.A: self.handle_left_key,
+            key.D: self.handle_right_key,
+        }
+        for num_key in self.num_keys:
+            # 1 selects the first item and 0 the last, as Player.select_active_item wraps the index around the
+            # inventory itself.
+            index = num_key - self.num_keys[0]
+            self.key_press_handlers[num_key] = lambda index=index: self.game_model.handle_change_active_block(index)
+
         #Issue 68 Instance of the model that handles the world.
         self.game_model = GameModel()
 
@@ -244,42 +262,77 @@ class Window(pyglet.window.Window):
         if self.paused:
             return
 
-        if symbol in self.num_keys:
-            index = (symbol - self.num_keys[0]) % len(self.game_model.player.inventory)
-            self.game_model.handle_change_active_block(index)
-            return
+        handler = self.key_press_handlers.get(symbol)
+        if handler is not None:
+            handler()
 
-        if symbol in [key.Q, key.E]:
-            increase_walk_speed = symbol == key.Q
-            increase_jump_speed = symbol == key.Q
-            self.game_model.handle_walk_speed_change(increase_walk_speed)
-            self.game_model.handle_jump_change(increase_jump_speed)
-            return
+    def handle_speed_increase_key(self) -> None:
+        """!
+        @brief Increases the walking and jump speed of the player.
+        @see [Issue#61](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/61)
+        """
+        self.game_model.handle_walk_speed_change(True)
+        self.game_model.handle_jump_change(True)
 
-        if symbol == key.TAB:
-            self.game_model.handle_flight_toggle()
+    def handle_speed_decrease_key(self) -> None:
+        """!
+        @brief Decreases the walking and jump speed of the player.
+        @see [Issue#61](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/61)
+        """
+        self.game_model.handle_walk_speed_change(False)
+        self.game_model.handle_jump_change(False)
 
-        elif symbol == key.LSHIFT:
-            if self.game_model.player.flying:
-                self.game_model.handle_flight(0, 1)
-            else:
-                self.game_model.player.slow_walking_speed()
+    def handle_flight_toggle_key(self) -> None:
+        """!
+        @brief Toggles whether the player is flying.
+        """
+        self.game_model.handle_flight_toggle()
 
-        if symbol == key.SPACE:
-            if self.game_model.player.flying:
-                self.game_model.handle_flight(1, 0)
-            else:
-                self.game_model.handle_jump()
+    def handle_shift_key(self) -> None:
+        """!
+        @brief Descends while flying, otherwise slows the player down to a walk.
+        """
+        if self.game_model.player.flying:
+            self.game_model.handle_flight(0, 1)
+        else:
+            self.game_model.player.slow_walking_speed()
 
-        forward = 1 if symbol == key.W else 0
-        backward = 1 if symbol == key.S else 0
-        left = 1 if symbol == key.A else 0
-        right = 1 if symbol == key.D else 0
-        self.game_model.handle_movement(forward, backward, left, right)
+    def handle_space_key(self) -> None:
+        """!
+        @brief Ascends while flying, otherwise makes the player jump.
+        """
+        if self.game_model.player.flying:
+            self.game_model.handle_flight(1, 0)
+        else:
+            self.game_model.handle_jump()
 
-        if symbol == key.W and self.is_double_click():  # Double click W to sprint
+    def handle_forward_key(self) -> None:
+        """!
+        @brief Moves the player forward, sprinting when the key is double clicked.
+        @see [Issue#97](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/97)
+        """
+        self.game_model.handle_movement(1, 0, 0, 0)
+        if self.is_double_click():
             self.game_model.player.start_sprinting()
 
+    def handle_backward_key(self) -> None:
+        """!
+        @brief Moves the player backward.
+        """
+        self.game_model.handle_movement(0, 1, 0, 0)
+
+    def handle_left_key(self) -> None:
+        """!
+        @brief Moves the player left.
+        """
+        self.game_model.handle_movement(0, 0, 1, 0)
+
+    def handle_right_key(self) -> None:
+        """!
+        @brief Moves the player right.
+        """
+        self.game_model.handle_movement(0, 0, 0, 1)
+
     def pause_game(self) -> None:
         """!
         @brief Pauses the game and bring up the pause menu.
@@ -404,8 +457,9 @@ class Window(pyglet.window.Window):
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         x, y = self.game_model.player.rotation_in_degrees
+        x_in_radians, _ = self.game_model.player.rotation_in_radians
         glRotatef(x, 0, 1, 0)
-        glRotatef(-y, math.cos(math.radians(x)), 0, math.sin(math.radians(x)))
+        glRotatef(-y, math.cos(x_in_radians), 0, math.sin(x_in_radians))
         x, y, z = self.game_model.player.position_in_blocks_from_origin
         glTranslatef(-x, -y, -z)
 
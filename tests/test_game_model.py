@@ -3,7 +3,7 @@ import pytest
 from unittest.mock import Mock
 from unittest.mock import patch
 from tempus_fugit_minecraft.game_model import GameModel
-from tempus_fugit_minecraft.player import Player
+from tempus_fugit_minecraft.player import Direction, Player
 from tempus_fugit_minecraft.block import Block
 from tempus_fugit_minecraft.world import World
 
@@ -231,15 +231,41 @@ class TestGameModel:
                     for right in [1, 0, -1]:
                         game_model.player.strafe_unit_vector = [0, 0]
                         game_model.handle_movement(forward, backward, left, right)
-                        assert game_model.player.strafe_unit_vector[0] == backward - forward
-                        assert game_model.player.strafe_unit_vector[1] == right - left
+                        assert game_model.player.strafe_unit_vector[0] == (backward == 1) - (forward == 1)
+                        assert game_model.player.strafe_unit_vector[1] == (right == 1) - (left == 1)
+
+    def test_handle_movement_sequence(self, game_model):
+        """!
+        @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
+        """
+        game_model.handle_movement(1, 0, 0, 0)
+        assert game_model.player.strafe_unit_vector == (-1, 0)
+
+        game_model.handle_movement(0, 0, 0, 1)
+        assert game_model.player.strafe_unit_vector == (-1, 1)
+
+        game_model.handle_movement(0, 1, 0, 0)
+        assert game_model.player.strafe_unit_vector == (0, 1)
+
+        game_model.handle_movement(0, -1, 0, 0)
+        assert game_model.player.strafe_unit_vector == (-1, 1)
+
+        game_model.handle_movement(-1, 0, 0, -1)
+        assert game_model.player.strafe_unit_vector == (0, 0)
+
+    def test_handle_movement_stopping_without_moving_does_not_move(self, game_model):
+        """!
+        @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
+        """
+        game_model.handle_movement(-1, -1, -1, -1)
+        assert game_model.player.strafe_unit_vector == (0, 0)
 
     def test_update_calls_player_update_eight_times(self, game_model):
         """!
         @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
         """
         game_model.sector = (0, 0, 0)
-        with patch.object(game_model.player, 'update', return_value = None) as player_update:
+        with patch.object(Player, 'update', return_value = None) as player_update:
             game_model.update(1)
             assert player_update.call_count == 8
 
@@ -250,6 +276,39 @@ class TestGameModel:
         game_model.update(1)
         assert game_model.sector is not None
 
+    def test_update_falling_at_terminal_velocity_lands_on_one_block_floor(self, game_model: GameModel):
+        """!
+        @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
+        """
+        for x in range(-1, 2):
+            for z in range(-1, 2):
+                game_model.world[(x, 0, z)] = Block.BRICK
+        game_model.player.position_in_blocks_from_origin = (0, 10, 0)
+        game_model.player.vertical_velocity_in_blocks_per_second = -game_model.player.MAX_FALL_SPEED_IN_BLOCKS_PER_SECOND
+        for _ in range(5):
+            game_model.update(0.2)
+        assert game_model.player.position_in_blocks_from_origin == (0, 1.75, 0)
+
+    def test_update_walking_at_max_speed_stops_at_one_block_wall(self, game_model: GameModel):
+        """!
+        @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
+        """
+        for x in range(-1, 8):
+            game_model.world[(x, 0, 0)] = Block.BRICK
+        game_model.world[(3, 1, 0)] = Block.BRICK
+        game_model.world[(3, 2, 0)] = Block.BRICK
+        game_model.player.position_in_blocks_from_origin = (0, 1.75, 0)
+        game_model.player.rotation_in_degrees = (90, 0)
+        for _ in range(3):
+            game_model.player.increase_walk_speed()
+        assert game_model.player.walking_speed_in_blocks_per_second == 20
+        game_model.player.press(Direction.FORWARD)
+        for _ in range(5):
+            game_model.update(0.2)
+        x, y, _ = game_model.player.position_in_blocks_from_origin
+        assert x == 2.25
+        assert y == 1.75
+
     def test_handle_adjust_vision(self, game_model):
         """!
         @see [issue#68](https://github.com/WSUCEG-7140/Tempus_Fugit_Minecraft/issues/68)
@@ -1,6 +1,6 @@
 import pytest
 import math
-from tempus_fugit_minecraft.player import Player
+from tempus_fugit_minecraft.player import Direction, Player
 from tempus_fugit_minecraft.world import World
 from tempus_fugit_minecraft.block import Block
 
@@ -13,11 +13,7 @@ def player():
 class TestPlayer:
     @pytest.fixture(autouse=True)
     def teardown(self, player: Player):
-        player.rotation_in_degrees = (0, 0)
-        player.flying = False
-        player.strafe_unit_vector = [0, 0]
-        player.walking_speed_in_blocks_per_second = 5
-        player.vertical_velocity_in_blocks_per_second = 0
+        player.reset()
 
     def test_new_player_construction(self, player: Player):
         assert player.flying == False
@@ -38,6 +34,19 @@ class TestPlayer:
         assert Block.BRICK == player.selected_block
         assert player.walking_speed_in_blocks_per_second == 5
 
+    def test_reset_restores_new_player_state(self, player: Player):
+        player.position_in_blocks_from_origin = (1, 2, 3)
+        player.rotation_in_degrees = (90, 45)
+        player.press(Direction.FORWARD)
+        player.toggle_flight()
+        player.select_active_item(2)
+        player.reset()
+        assert player.position_in_blocks_from_origin == (0, 0, 0)
+        assert player.rotation_in_degrees == (0, 0)
+        assert player.strafe_unit_vector == (0, 0)
+        assert player.flying == False
+        assert player.selected_block == Block.BRICK
+
     def test_get_sight_vector_no_rotation(self, player: Player):
         player.rotation_in_degrees = (0, 0)
         result = player.get_sight_vector()
@@ -232,6 +241,22 @@ class TestPlayer:
         player.decrease_walk_speed()
         assert player.walking_speed_in_blocks_per_second == 1 * player.WALK_SPEED_IN_BLOCKS_PER_SECOND
 
+    def test_increase_walk_speed_while_sprinting_keeps_speed(self, player: Player):
+        player.walking_speed_in_blocks_per_second = 30
+        player.increase_walk_speed()
+        assert player.walking_speed_in_blocks_per_second == 30
+
+    def test_decrease_walk_speed_while_walking_slowly_keeps_speed(self, player: Player):
+        player.slow_walking_speed()
+        player.decrease_walk_speed()
+        assert player.walking_speed_in_blocks_per_second == 5 / 3
+
+    def test_increase_then_decrease_walk_speed_while_walking_slowly_restores_speed(self, player: Player):
+        player.slow_walking_speed()
+        player.increase_walk_speed()
+        player.decrease_walk_speed()
+        assert math.isclose(player.walking_speed_in_blocks_per_second, 5 / 3)
+
     def test_jump_no_vertical_velocity(self, player: Player):
         player.jump()
         assert player.vertical_velocity_in_blocks_per_second == player.jump_speed_in_blocks_per_second 
@@ -241,20 +266,20 @@ class TestPlayer:
         player.jump()
         assert player.vertical_velocity_in_blocks_per_second == 5
 
-    def test_move_forward(self, player: Player):
-        player.move_forward()
+    def test_press_forward(self, player: Player):
+        player.press(Direction.FORWARD)
         assert player.strafe_unit_vector[0] == -1
 
-    def test_move_backward(self, player: Player):
-        player.move_backward()
+    def test_press_backward(self, player: Player):
+        player.press(Direction.BACKWARD)
         assert player.strafe_unit_vector[0] == 1
 
-    def test_move_left(self, player: Player):
-        player.move_left()
+    def test_press_left(self, player: Player):
+        player.press(Direction.LEFT)
         assert player.strafe_unit_vector[1] == -1
 
-    def test_move_right(self, player: Player):
-        player.move_right()
+    def test_press_right(self, player: Player):
+        player.press(Direction.RIGHT)
         assert player.strafe_unit_vector[1] == 1
 
     def test_select_active_item_index_zero_first_item(self, player: Player):
@@ -269,26 +294,47 @@ class TestPlayer:
         player.select_active_item(-1)
         assert player.selected_block == player.inventory[(len(player.inventory) - 1)]
 
-    def test_stop_forward(self, player: Player):
-        player.strafe_unit_vector[0] = -1
-        player.stop_forward()
+    def test_release_forward(self, player: Player):
+        player.press(Direction.FORWARD)
+        player.release(Direction.FORWARD)
         assert player.strafe_unit_vector[0] == 0
 
-    def test_stop_backward(self, player: Player):
-        player.strafe_unit_vector[0] = 1
-        player.stop_backward()
+    def test_release_backward(self, player: Player):
+        player.press(Direction.BACKWARD)
+        player.release(Direction.BACKWARD)
         assert player.strafe_unit_vector[0] == 0
 
-    def test_stop_left(self, player: Player):
-        player.strafe_unit_vector[1] = -1
-        player.stop_left()
+    def test_release_left(self, player: Player):
+        player.press(Direction.LEFT)
+        player.release(Direction.LEFT)
         assert player.strafe_unit_vector[1] == 0
 
-    def test_stop_right(self, player: Player):
-        player.strafe_unit_vector[1] = 1
-        player.stop_right()
+    def test_release_right(self, player: Player):
+        player.press(Direction.RIGHT)
+        player.release(Direction.RIGHT)
         assert player.strafe_unit_vector[1] == 0
 
+    def test_press_twice_stays_unit_length(self, player: Player):
+        player.press(Direction.FORWARD)
+        player.press(Direction.FORWARD)
+        assert player.strafe_unit_vector == (-1, 0)
+
+    def test_press_opposite_direction_cancels_movement(self, player: Player):
+        player.press(Direction.FORWARD)
+        player.press(Direction.BACKWARD)
+        assert player.strafe_unit_vector == (0, 0)
+
+    def test_release_opposite_direction_keeps_held_movement(self, player: Player):
+        player.press(Direction.FORWARD)
+        player.press(Direction.BACKWARD)
+        player.release(Direction.BACKWARD)
+        assert player.strafe_unit_vector == (-1, 0)
+
+    def test_release_other_direction_keeps_movement(self, player: Player):
+        player.press(Direction.LEFT)
+        player.release(Direction.RIGHT)
+        assert player.strafe_unit_vector == (0, -1)
+
     def test_adjust_sight_by_one_in_x_dir(self, player: Player):
         player.adjust_sight(1, 0)
         x, _ = player.rotation_in_degrees
@@ -410,6 +456,11 @@ class TestPlayer:
         player.slow_walking_speed()
         assert player.walking_speed_in_blocks_per_second == 5/3
 
+    def test_slow_walk_while_sprinting(self, player):
+        player.start_sprinting()
+        player.slow_walking_speed()
+        assert player.walking_speed_in_blocks_per_second == 10/3
+
     #issue98
     def test_sprint(self, player):
         assert player.walking_speed_in_blocks_per_second == 5
@@ -117,6 +117,17 @@ class TestWindow:
         window.on_mouse_drag(window.volume_knob_sprite.x + 3, window.volume_knob_sprite.y + 5, 100, 0, pyglet.window.mouse.LEFT, None)
         assert window.volume_knob_sprite.x > window.max_volume_position
 
+    def test_num_keys_select_inventory_items(self, window):
+        player = window.game_model.player
+        window.on_key_press(pyglet.window.key._1, Mock())
+        assert player.selected_block == player.inventory[0]
+
+        window.on_key_press(pyglet.window.key._3, Mock())
+        assert player.selected_block == player.inventory[2]
+
+        window.on_key_press(pyglet.window.key._0, Mock())
+        assert player.selected_block == player.inventory[-1]
+
     def test_is_double_click(self, window):
         assert not window.is_double_click()
         window.on_key_press(pyglet.window.key.W, Mock())
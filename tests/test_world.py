@@ -6,6 +6,8 @@ from tempus_fugit_minecraft.block import Block
 from tempus_fugit_minecraft.game_model import GameModel
 from tempus_fugit_minecraft.world import World
 
+_GROUND_BLOCKS = frozenset({Block.GRASS, Block.SAND})
+
 
 @pytest.fixture(scope='class')
 def game_model():
@@ -13,44 +15,45 @@ def game_model():
     game_model.world.clear()
     yield game_model
 
+@pytest.fixture(scope='module')
+def clouds():
+    yield World.generate_clouds(World.WIDTH_FROM_ORIGIN_IN_BLOCKS, 100)
+
+@pytest.fixture(scope='module')
+def cloud_blocks(clouds):
+    yield [ (block, position) for cloud in clouds for block, position in cloud ]
+
 class TestWorld:
     @pytest.fixture(autouse=True)
     def teardown(self, game_model):
         game_model.world.clear()
 
     #issue20; #issue28
-    def test_cloud_height(self):
-        clouds = World.generate_clouds(World.WIDTH_FROM_ORIGIN_IN_BLOCKS, 100)
-        for cloud in clouds:
-            for _, (_, y, _) in cloud:
-                assert y >= 18
+    def test_cloud_height(self, cloud_blocks):
+        for _, (_, y, _) in cloud_blocks:
+            assert y >= 18
 
     #issue20; #issue28
-    def test_non_overlapping_clouds(self, game_model: GameModel):
-        clouds = World.generate_clouds(80, 100)
+    def test_non_overlapping_clouds(self, game_model: GameModel, clouds, cloud_blocks):
         assert len(clouds) == 100
 
-        for cloud in clouds:
-            for block, position in cloud:
-                game_model.add_block(position, block, immediate=False)
+        for block, position in cloud_blocks:
+            game_model.add_block(position, block, immediate=False)
 
         positions_of_all_cloud_blocks = [ position for position in game_model.world ]
         unique_clouds_positions = set(positions_of_all_cloud_blocks)
         assert len(positions_of_all_cloud_blocks) == len(unique_clouds_positions)
 
     #issue20, issue28
-    def test_clouds_created_dynamically(self):
-        clouds = World.generate_clouds(World.WIDTH_FROM_ORIGIN_IN_BLOCKS, 100)
-        unique_cloud_types = set([ block for cloud in clouds for block, _ in cloud ])
+    def test_clouds_created_dynamically(self, cloud_blocks):
+        unique_cloud_types = set([ block for block, _ in cloud_blocks ])
         assert Block.LIGHT_CLOUD in unique_cloud_types
         assert Block.DARK_CLOUD in unique_cloud_types
 
     #issue20; #issue28
-    def test_cloud_positions(self):
-        clouds = World.generate_clouds(World.WIDTH_FROM_ORIGIN_IN_BLOCKS, 100)
+    def test_cloud_positions(self, cloud_blocks):
         clouds_limitations = World.WIDTH_FROM_ORIGIN_IN_BLOCKS + 2 * 6  # + 2*6 to ensure that the test will cover cloud block outside the world
-        cloud_blocks = [ position for cloud in clouds for _, position in cloud ]
-        for x, _, z in cloud_blocks:
+        for _, (x, _, z) in cloud_blocks:
             assert -clouds_limitations <= x <= clouds_limitations
             assert -clouds_limitations <= z <= clouds_limitations
 
@@ -132,7 +135,7 @@ class TestWorld:
             assert block == Block.TREE_TRUNK
 
             grass_pos = (x, y - 1, z)
-            assert game_model.world[grass_pos] in [Block.GRASS, Block.SAND]
+            assert game_model.world[grass_pos] in _GROUND_BLOCKS
 
             trunks = [ position for block, position in tree if block == Block.TREE_TRUNK ]
             leaves = [ position for block, position in tree if block == Block.TREE_LEAVES ]
@@ -156,7 +159,7 @@ class TestWorld:
             assert block == Block.TREE_TRUNK
 
             grass_pos = (x, y - 1, z)
-            assert game_model.world[grass_pos] in [Block.GRASS, Block.SAND]
+            assert game_model.world[grass_pos] in _GROUND_BLOCKS
 
             trunks = [ position for block, position in tree if block == Block.TREE_TRUNK ]
             leaves = [ position for block, position in tree if block == Block.TREE_LEAVES ]
@@ -176,7 +179,7 @@ class TestWorld:
             assert block == Block.TREE_TRUNK
 
             grass_pos = (x, y - 1, z)
-            assert game_model.world[grass_pos] in [Block.GRASS, Block.SAND]
+            assert game_model.world[grass_pos] in _GROUND_BLOCKS
 
     # issue80
     def test_tree_built_on_top_of_ground_level_grass_or_sand(self, game_model):
@@ -185,7 +188,7 @@ class TestWorld:
         trees = World.generate_trees(game_model, 50)
         for single_tree in trees:
             _, (x, y, z) = single_tree[0]
-            assert game_model.world[(x, y - 1, z)] in [Block.GRASS,Block.SAND]
+            assert game_model.world[(x, y - 1, z)] in _GROUND_BLOCKS
 
     def test_generate_hill_blocks_are_either_grass_sand_brick(self):
         hill = World.generate_hill(0, 0)